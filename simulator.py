@@ -9,16 +9,85 @@ Generates realistic GitHub commit history with natural patterns:
 - Configurable intensity profiles
 """
 
+import collections
+import itertools
 import random
 import datetime
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Dict, Optional
-from pathlib import Path
-import argparse
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: it accelerates simulate() for long date ranges,
+    # but the pure-Python path works without it.
+    np = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: stdlib json is used for export without it.
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: with it, the simulation kernel below is JIT
+    # compiled; without it, the NumPy or pure-Python path is used.
+    njit = None
+
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _simulate_core(n_days, start_weekday, daily_prob, weekend_reduction,
+                       avg, max_commits, burst_prob, burst_mult,
+                       hour_values, hour_cum_weights, seed):
+        """
+        Compiled simulation kernel: returns (day_index, day_seconds)
+        arrays describing every commit in chronological order.
+        """
+        if seed >= 0:
+            np.random.seed(seed)
+
+        day_index = np.empty(n_days * max_commits, np.int64)
+        day_seconds = np.empty(n_days * max_commits, np.int64)
+        n = 0
+
+        for d in range(n_days):
+            prob = daily_prob
+            if (start_weekday + d) % 7 >= 5:
+                prob *= weekend_reduction
+            if np.random.random() >= prob:
+                continue
+
+            count = int(np.random.normal(avg, avg * 0.5))
+            if count < 1:
+                count = 1
+            if np.random.random() < burst_prob:
+                count = int(count * burst_mult)
+            if count > max_commits:
+                count = max_commits
+
+            start_n = n
+            for _ in range(count):
+                hour = hour_values[
+                    np.searchsorted(hour_cum_weights, np.random.random(),
+                                    side='right')
+                ]
+                day_index[n] = d
+                day_seconds[n] = (hour * 3600
+                                  + np.random.randint(0, 60) * 60
+                                  + np.random.randint(0, 60))
+                n += 1
+            day_seconds[start_n:n] = np.sort(day_seconds[start_n:n])
+
+        return day_index[:n], day_seconds[:n]
+else:
+    _simulate_core = None
+
+
+@dataclass(slots=True)
 class Commit:
     """Represents a single commit with timestamp and message."""
     timestamp: datetime.datetime
@@ -72,72 +141,119 @@ class ContributionProfile:
             raise ValueError(f"Intensity must be one of: {list(self.PROFILES.keys())}")
         self.config = self.PROFILES[intensity]
         self.intensity = intensity
-    
+        self._init_hour_distribution()
+
     def get_config(self, key: str):
         return self.config[key]
 
+    def _init_hour_distribution(self):
+        """
+        Precompute the commit-hour distribution: peak hours (10-12 and
+        14-17) are more likely than the rest of the working window.
+        """
+        start = self.config['commit_time_start']
+        end = self.config['commit_time_end']
+        self.hour_values = list(range(start, end + 1))
+        weights = [
+            0.7 if 10 <= h <= 12 or 14 <= h <= 17 else 0.4
+            for h in self.hour_values
+        ]
+        total = sum(weights)
+        self.hour_weights = [w / total for w in weights]
+        self.hour_cum_weights = list(itertools.accumulate(self.hour_weights))
+
 
 class CommitMessageGenerator:
     """Generates realistic commit messages."""
     
-    PREFIXES = [
+    PREFIXES = (
         "feat", "fix", "docs", "style", "refactor",
         "test", "chore", "perf", "build", "ci", "wip"
-    ]
+    )
     
-    ACTIONS = [
+    ACTIONS = (
         "update", "add", "remove", "fix", "implement",
         "refactor", "optimize", "improve", "clean up",
         "rework", "simplify", "enhance", "adjust",
         "tweak", "revise", "modify", "patch"
-    ]
+    )
     
-    OBJECTS = [
+    OBJECTS = (
         "README", "config", "tests", "utils", "helpers",
         "main module", "API", "docs", "dependencies",
         "deployment", "CI config", "error handling",
         "validation", "logging", "database", "models",
         "routes", "components", "styles", "assets"
-    ]
+    )
     
-    DETAILS = [
+    DETAILS = (
         "for better performance", "to handle edge cases",
         "based on feedback", "for compatibility",
         "to fix bug", "as requested", "for clarity",
         "per review comments", "to improve UX",
         "to address security issue", "", "", ""  # Empty for variety
-    ]
+    )
     
     @classmethod
-    def generate(cls) -> str:
+    def generate(cls, rng: random.Random = random) -> str:
         """Generate a random commit message."""
-        style = random.random()
+        style = rng.random()
         
         if style < 0.4:
             # Conventional commit style: feat: add something
-            prefix = random.choice(cls.PREFIXES)
-            action = random.choice(cls.ACTIONS)
-            obj = random.choice(cls.OBJECTS)
-            detail = random.choice(cls.DETAILS)
+            prefix = rng.choice(cls.PREFIXES)
+            action = rng.choice(cls.ACTIONS)
+            obj = rng.choice(cls.OBJECTS)
+            detail = rng.choice(cls.DETAILS)
             if detail:
                 return f"{prefix}: {action} {obj} {detail}"
             return f"{prefix}: {action} {obj}"
         
         elif style < 0.7:
             # Simple action: Update something
-            action = random.choice(cls.ACTIONS).capitalize()
-            obj = random.choice(cls.OBJECTS)
+            action = rng.choice(cls.ACTIONS).capitalize()
+            obj = rng.choice(cls.OBJECTS)
             return f"{action} {obj}"
         
         else:
             # More verbose: Fix issue with component
-            action = random.choice(cls.ACTIONS)
-            obj = random.choice(cls.OBJECTS)
-            detail = random.choice(cls.DETAILS)
+            action = rng.choice(cls.ACTIONS)
+            obj = rng.choice(cls.OBJECTS)
+            detail = rng.choice(cls.DETAILS)
             if detail:
                 return f"{action} {obj} {detail}"
             return f"{action} {obj}"
 
+    @classmethod
+    def generate_bulk(cls, n: int, rng: random.Random = random) -> List[str]:
+        """
+        Generate n random commit messages at once.
+
+        Draws every selector up front with choices() instead of making
+        2-4 choice() calls per message.
+        """
+        styles = rng.choices((0, 1, 2), cum_weights=(0.4, 0.7, 1.0), k=n)
+        prefixes = rng.choices(cls.PREFIXES, k=n)
+        actions = rng.choices(cls.ACTIONS, k=n)
+        objects = rng.choices(cls.OBJECTS, k=n)
+        details = rng.choices(cls.DETAILS, k=n)
+
+        messages = []
+        for style, prefix, action, obj, detail in zip(
+                styles, prefixes, actions, objects, details):
+            if style == 0:
+                # Conventional commit style: feat: add something
+                msg = f"{prefix}: {action} {obj}"
+            elif style == 1:
+                # Simple action: Update something
+                msg = f"{action.capitalize()} {obj}"
+                detail = ''
+            else:
+                # More verbose: Fix issue with component
+                msg = f"{action} {obj}"
+            messages.append(f"{msg} {detail}" if detail else msg)
+        return messages
+
 
 class ContributionSimulator:
     """Simulates GitHub contribution patterns over time."""
@@ -162,126 +278,198 @@ class ContributionSimulator:
         self.end_date = end_date or datetime.date.today()
         self.profile = ContributionProfile(intensity)
         self.seed = seed
-        
-        if seed is not None:
-            random.seed(seed)
-    
-    def _should_commit_today(self, date: datetime.date) -> bool:
+
+        # Cache profile values as attributes so the per-day loops avoid
+        # repeated get_config dict lookups
+        cfg = self.profile.config
+        self._daily_prob = cfg['daily_commit_prob']
+        self._weekend_reduction = cfg['weekend_reduction']
+        self._avg_commits = cfg['avg_commits_per_day']
+        self._max_commits = cfg['max_commits_per_day']
+        self._burst_prob = cfg['burst_probability']
+        self._burst_mult = cfg['burst_multiplier']
+
+        # Dedicated RNG: avoids the shared module-level singleton and
+        # keeps seeded runs reproducible regardless of other random users
+        self.rng = random.Random(seed)
+
+    def _should_commit_today(self, date: datetime.date,
+                             weekday: Optional[int] = None) -> bool:
         """Determine if any commits should happen on this date."""
-        base_prob = self.profile.get_config('daily_commit_prob')
-        
+        if weekday is None:
+            weekday = date.weekday()
+        base_prob = self._daily_prob
+
         # Reduce probability on weekends
-        if date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            base_prob *= self.profile.get_config('weekend_reduction')
-        
-        return random.random() < base_prob
-    
+        if weekday >= 5:  # Saturday = 5, Sunday = 6
+            base_prob *= self._weekend_reduction
+
+        return self.rng.random() < base_prob
+
     def _get_commit_count(self, date: datetime.date) -> int:
         """Determine how many commits for this date."""
-        avg = self.profile.get_config('avg_commits_per_day')
-        max_commits = self.profile.get_config('max_commits_per_day')
-        
         # Add some randomness around the average
-        count = max(1, int(random.gauss(avg, avg * 0.5)))
-        
+        count = max(1, int(self.rng.gauss(self._avg_commits, self._avg_commits * 0.5)))
+
         # Check for burst day
-        if random.random() < self.profile.get_config('burst_probability'):
-            count = int(count * self.profile.get_config('burst_multiplier'))
-        
-        return min(count, max_commits)
+        if self.rng.random() < self._burst_prob:
+            count = int(count * self._burst_mult)
+
+        return min(count, self._max_commits)
     
     def _generate_commit_times(self, date: datetime.date, count: int) -> List[datetime.datetime]:
         """Generate realistic timestamps for commits on a given day."""
-        start_hour = self.profile.get_config('commit_time_start')
-        end_hour = self.profile.get_config('commit_time_end')
-        
+        # Hours are drawn from the precomputed work-hour-biased
+        # distribution in a single call instead of rejection sampling
+        hours = self.rng.choices(
+            self.profile.hour_values,
+            cum_weights=self.profile.hour_cum_weights,
+            k=count
+        )
+
         times = []
-        for _ in range(count):
-            # Generate hour with bias toward mid-day/work hours
-            hour = self._biased_hour(start_hour, end_hour)
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            
+        for hour in hours:
+            minute = self.rng.randint(0, 59)
+            second = self.rng.randint(0, 59)
+
             dt = datetime.datetime(
                 date.year, date.month, date.day,
                 hour, minute, second
             )
             times.append(dt)
-        
+
         # Sort chronologically
         times.sort()
         return times
     
-    def _biased_hour(self, start: int, end: int) -> int:
-        """
-        Generate hour with bias toward typical work hours.
-        More commits between 10-12 and 14-17.
-        """
-        # Try a few times to get a work-hour-biased time
-        attempts = 0
-        while attempts < 10:
-            hour = random.randint(start, end)
-            
-            # Peak hours get bonus probability
-            if 10 <= hour <= 12 or 14 <= hour <= 17:
-                if random.random() < 0.7:  # 70% chance to accept peak hours
-                    return hour
-            elif random.random() < 0.4:  # 40% chance for off-peak
-                return hour
-            
-            attempts += 1
-        
-        return random.randint(start, end)
-    
-    def generate_day(self, date: datetime.date) -> List[Commit]:
+    def generate_day(self, date: datetime.date,
+                     weekday: Optional[int] = None) -> List[Commit]:
         """Generate all commits for a single day."""
-        if not self._should_commit_today(date):
+        if not self._should_commit_today(date, weekday):
             return []
         
         count = self._get_commit_count(date)
         times = self._generate_commit_times(date, count)
-        
-        commits = []
-        for dt in times:
-            message = CommitMessageGenerator.generate()
-            commits.append(Commit(timestamp=dt, message=message))
-        
-        return commits
+        messages = CommitMessageGenerator.generate_bulk(len(times), self.rng)
+
+        return [
+            Commit(timestamp=dt, message=message)
+            for dt, message in zip(times, messages)
+        ]
     
     def simulate(self) -> List[Commit]:
         """
         Run the full simulation from start to end date.
-        
+
+        Uses the compiled Numba kernel when available, then bulk NumPy
+        draws, otherwise falls back to the per-day Python loop.
+
         Returns:
             List of Commit objects in chronological order
         """
+        if _simulate_core is not None:
+            return self._simulate_numba()
+        if np is not None:
+            return self._simulate_numpy()
+
         all_commits = []
         current_date = self.start_date
-        
+        # Track the weekday as a rotating counter instead of calling
+        # date.weekday() once per simulated day
+        weekday = current_date.weekday()
+
         while current_date <= self.end_date:
-            day_commits = self.generate_day(current_date)
+            day_commits = self.generate_day(current_date, weekday)
             all_commits.extend(day_commits)
             current_date += datetime.timedelta(days=1)
-        
+            weekday = (weekday + 1) % 7
+
         return all_commits
+
+    def _simulate_numpy(self) -> List[Commit]:
+        """
+        Vectorized simulation: draw all random values for the whole date
+        range in bulk instead of several RNG calls per day.
+        """
+        rng = np.random.default_rng(self.seed)
+        n_days = (self.end_date - self.start_date).days + 1
+
+        # Which days are active (weekends are less likely)
+        weekdays = (self.start_date.weekday() + np.arange(n_days)) % 7
+        probs = np.where(weekdays >= 5,
+                         self._daily_prob * self._weekend_reduction,
+                         self._daily_prob)
+        active = rng.random(n_days) < probs
+
+        # How many commits on each day, with occasional bursts
+        avg = self._avg_commits
+        counts = np.maximum(1, rng.normal(avg, avg * 0.5, n_days).astype(int))
+        bursts = rng.random(n_days) < self._burst_prob
+        counts = np.where(bursts, (counts * self._burst_mult).astype(int), counts)
+        counts = np.minimum(counts, self._max_commits)
+        counts = np.where(active, counts, 0)
+
+        total = int(counts.sum())
+        day_index = np.repeat(np.arange(n_days), counts)
+
+        # Timestamps within each day, as seconds since midnight, with
+        # hours drawn from the work-hour-biased distribution
+        hours = rng.choice(self.profile.hour_values, size=total,
+                           p=self.profile.hour_weights)
+        minutes = rng.integers(0, 60, total)
+        seconds = rng.integers(0, 60, total)
+        day_seconds = hours * 3600 + minutes * 60 + seconds
+
+        # Sort all commits chronologically in one pass: keyed by day
+        # first, then by time of day, instead of a small sort per day
+        day_seconds = day_seconds[np.lexsort((day_seconds, day_index))]
+
+        return self._build_commits(day_index, day_seconds)
+
+    def _simulate_numba(self) -> List[Commit]:
+        """
+        Run the compiled simulation kernel, then materialize Commit
+        objects and messages in Python.
+        """
+        day_index, day_seconds = _simulate_core(
+            (self.end_date - self.start_date).days + 1,
+            self.start_date.weekday(),
+            self._daily_prob,
+            self._weekend_reduction,
+            float(self._avg_commits),
+            self._max_commits,
+            self._burst_prob,
+            self._burst_mult,
+            np.asarray(self.profile.hour_values, dtype=np.int64),
+            np.asarray(self.profile.hour_cum_weights, dtype=np.float64),
+            -1 if self.seed is None else self.seed,
+        )
+        return self._build_commits(day_index, day_seconds)
+
+    def _build_commits(self, day_index, day_seconds) -> List[Commit]:
+        """Turn (day offset, seconds-of-day) arrays into Commit objects."""
+        base = datetime.datetime.combine(self.start_date, datetime.time())
+        messages = CommitMessageGenerator.generate_bulk(len(day_index), self.rng)
+        return [
+            Commit(
+                timestamp=base + datetime.timedelta(days=int(d), seconds=int(s)),
+                message=message
+            )
+            for d, s, message in zip(day_index, day_seconds, messages)
+        ]
     
     def get_stats(self, commits: List[Commit]) -> Dict:
         """Calculate statistics about generated commits."""
         if not commits:
             return {}
-        
-        by_date = {}
-        by_weekday = {i: 0 for i in range(7)}
-        by_hour = {i: 0 for i in range(24)}
-        
-        for commit in commits:
-            date_key = commit.timestamp.date()
-            by_date[date_key] = by_date.get(date_key, 0) + 1
-            by_weekday[commit.timestamp.weekday()] += 1
-            by_hour[commit.timestamp.hour] += 1
-        
+
+        by_date = collections.Counter(c.timestamp.date() for c in commits)
+        by_weekday = collections.Counter(c.timestamp.weekday() for c in commits)
+        hour_counts = collections.Counter(c.timestamp.hour for c in commits)
+        by_hour = {i: hour_counts[i] for i in range(24)}
+
         daily_counts = list(by_date.values())
-        
+
         return {
             'total_commits': len(commits),
             'active_days': len(by_date),
@@ -296,16 +484,31 @@ class ContributionSimulator:
 
 
 def export_to_json(commits: List[Commit], filepath: str):
-    """Export commits to JSON format."""
-    data = {
-        'commits': [c.to_dict() for c in commits],
-        'total': len(commits)
-    }
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    """
+    Export commits as JSON Lines: one commit object per line.
+
+    Streams each line straight to a buffered file instead of building
+    one large indented document in memory. Uses orjson when installed,
+    which encodes several times faster than stdlib json.
+    """
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        if orjson is not None:
+            for c in commits:
+                f.write(orjson.dumps(
+                    {'timestamp': c.timestamp, 'message': c.message}
+                ))
+                f.write(b'\n')
+        else:
+            dumps = json.dumps
+            for c in commits:
+                f.write(dumps(c.to_dict(), separators=(',', ':')).encode('utf-8'))
+                f.write(b'\n')
 
 
 def main():
+    # Imported here so library users of this module skip the cost
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Simulate GitHub contribution history',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -313,7 +516,7 @@ def main():
 Examples:
   %(prog)s --start 2020-01-01 --intensity medium
   %(prog)s --start 2022-06-01 --end 2023-06-01 --intensity heavy --seed 42
-  %(prog)s --start 2021-01-01 --export commits.json
+  %(prog)s --start 2021-01-01 --export commits.jsonl
         """
     )
     
@@ -327,7 +530,7 @@ Examples:
     parser.add_argument('--seed', type=int,
                         help='Random seed for reproducible results')
     parser.add_argument('--export', '-o',
-                        help='Export commits to JSON file')
+                        help='Export commits to JSON Lines file (one commit per line)')
     parser.add_argument('--stats-only', action='store_true',
                         help='Only show statistics, no commit list')
     
@@ -365,7 +568,7 @@ Examples:
     if not args.stats_only:
         print(f"\n📝 First 10 commits:")
         for commit in commits[:10]:
-            print(f"   {commit.timestamp.strftime('%Y-%m-%d %H:%M')} - {commit.message}")
+            print(f"   {commit.timestamp.isoformat(sep=' ', timespec='minutes')} - {commit.message}")
         
         if len(commits) > 10:
             print(f"   ... and {len(commits) - 10} more")